@@ -4,12 +4,18 @@ SIMPLE Auto-Healer - Guaranteed to work
 """
 
 import os
-import glob
 import logging
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Directories that are never descended into (hidden ones like .git are
+# already skipped); dependency trees must not be renamed
+_SKIP = frozenset({'node_modules'})
+
+def _needs_fix(name):
+    """Return True if a file name matches any of the problematic patterns"""
+    return ' ' in name or '@' in name or name.endswith(('.jx', '.htm', '.PY'))
+
 class SimpleAutoHealer:
     def __init__(self):
         self.fixes_applied = []
@@ -17,24 +23,47 @@ class SimpleAutoHealer:
     def fix_file_names(self, root_path):
         """Fix all problematic file names"""
         
-        # Patterns to find problematic files
-        patterns = [
-            os.path.join(root_path, "**", "* *"),  # Files with spaces
-            os.path.join(root_path, "**", "*.jx"),  # Wrong JS extension
-            os.path.join(root_path, "**", "*.htm"),  # Wrong HTML extension
-            os.path.join(root_path, "**", "*.PY"),  # Wrong Python extension
-            os.path.join(root_path, "**", "*@*"),  # Files with @
-        ]
+        subdirs = []
+        matches = []
+        
+        try:
+            with os.scandir(root_path) as it:
+                entries = list(it)
+        except OSError:
+            # Unreadable or vanished directory: skip it, as glob did
+            return
+        
+        # Single pass over each directory; hidden entries are skipped like glob did
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _SKIP:
+                    subdirs.append(entry.path)
+            elif entry.is_file() and _needs_fix(entry.name):
+                matches.append(entry.name)
         
-        for pattern in patterns:
-            for file_path in glob.glob(pattern, recursive=True):
-                if os.path.isfile(file_path):
-                    self.fix_single_file(file_path)
+        # Rename only after the directory listing is closed, relative to a
+        # single directory fd so each rename skips the full path lookup
+        dir_fd = None
+        if matches and os.rename in os.supports_dir_fd:
+            try:
+                dir_fd = os.open(root_path, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                # Fall back to path-based renames rather than abort the heal
+                dir_fd = None
+        try:
+            for name in matches:
+                self.fix_single_file(root_path, name, dir_fd)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+        
+        for subdir in subdirs:
+            self.fix_file_names(subdir)
     
-    def fix_single_file(self, file_path):
-        """Fix a single problematic file"""
-        directory = os.path.dirname(file_path)
-        old_name = os.path.basename(file_path)
+    def fix_single_file(self, directory, old_name, dir_fd=None):
+        """Fix a single problematic file, optionally relative to its open directory"""
         new_name = old_name
         
         # Apply fixes
@@ -44,27 +73,28 @@ class SimpleAutoHealer:
         if '@' in new_name:
             new_name = new_name.replace('@', '-')
         
+        # Convert to lowercase first, so the extension rules below also catch
+        # .JX/.HTM/.PY; name and extension are lowered separately so
+        # context-dependent rules (Greek final sigma) don't cross the dot
+        dot = new_name.rfind('.')
+        if dot >= 0:
+            new_name = new_name[:dot].lower() + new_name[dot:].lower()
+        else:
+            new_name = new_name.lower()
+        
         if new_name.endswith('.jx'):
             new_name = new_name.replace('.jx', '.js')
         
         if new_name.endswith('.htm') and not new_name.endswith('.html'):
             new_name = new_name + 'l'  # .htm -> .html
         
-        if new_name.endswith('.PY'):
-            new_name = new_name.replace('.PY', '.py')
-        
-        # Convert to lowercase (except extensions)
-        if '.' in new_name:
-            name_part, ext_part = new_name.rsplit('.', 1)
-            new_name = name_part.lower() + '.' + ext_part.lower()
-        else:
-            new_name = new_name.lower()
-        
         # Rename if changed
         if new_name != old_name:
-            new_path = os.path.join(directory, new_name)
             try:
-                os.rename(file_path, new_path)
+                if dir_fd is not None:
+                    os.rename(old_name, new_name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+                else:
+                    os.rename(os.path.join(directory, old_name), os.path.join(directory, new_name))
                 self.fixes_applied.append(f"{old_name} → {new_name}")
                 logger.info(f"✅ FIXED: {old_name} → {new_name}")
             except Exception as e:
@@ -80,8 +110,11 @@ class SimpleAutoHealer:
         os.makedirs(public_dir, exist_ok=True)
         
         # If index.htm exists, rename it
-        if os.path.exists(index_htm):
+        try:
             os.rename(index_htm, index_html)
+        except FileNotFoundError:
+            pass
+        else:
             self.fixes_applied.append("index.htm → index.html")
             logger.info("✅ FIXED: index.htm → index.html")
         
@@ -102,6 +135,9 @@ class SimpleAutoHealer:
             logger.info("✅ CREATED: index.html")
 
 def main():
+    # Configure the root logger only when run as a script, not on import
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    
     healer = SimpleAutoHealer()
     
     logger.info("🚀 STARTING SIMPLE AUTO-HEALER")
@@ -7,6 +7,63 @@ import os
 import json
 from pathlib import Path
 
+# Extensions flagged as non-standard by the per-file checks
+_NONSTANDARD_EXTS = ('.jx', '.htm')
+
+# Directories that are never descended into
+_SKIP = frozenset({'node_modules', '.git', '__pycache__', '.venv', 'dist', 'build'})
+
+def _scan_entries(path, analysis):
+    """Check the files directly in a directory and return its subdirectories"""
+
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        # Unreadable or vanished directory: skip it, as os.walk did
+        return []
+
+    analysis['directory_count'] += 1
+
+    subdirs = []
+
+    for entry in entries:
+        # Like os.walk: anything that isn't a directory counts as a file, and
+        # symlinks to directories are listed but not followed
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+
+        if is_dir:
+            # Skip unnecessary directories
+            if entry.name not in _SKIP and not entry.is_symlink():
+                subdirs.append(entry.path)
+            continue
+
+        analysis['file_count'] += 1
+        file = entry.name
+
+        # Check for common issues
+        if ' ' in file:
+            analysis['issues'].append(f"Space in filename: {Path(entry.path)}")
+
+        # islower() is a non-allocating pre-check for the common lowercase case
+        if not file.islower() and file != file.lower() and not file.startswith('README'):
+            analysis['issues'].append(f"Uppercase in filename: {Path(entry.path)}")
+
+        if file.endswith(_NONSTANDARD_EXTS):
+            analysis['issues'].append(f"Non-standard extension: {Path(entry.path)}")
+
+    return subdirs
+
+def _scan_directory(path, analysis):
+    """Walk a directory with os.scandir, recording counts and issues"""
+
+    # Recurse after the files so issues keep the top-down order of os.walk
+    for subdir in _scan_entries(path, analysis):
+        _scan_directory(subdir, analysis)
+
 def analyze_project_structure(root_path):
     """Analyze project structure and return health report"""
     
@@ -17,26 +74,7 @@ def analyze_project_structure(root_path):
         'directory_count': 0
     }
     
-    for root, dirs, files in os.walk(root_path):
-        # Skip unnecessary directories
-        if any(skip in root for skip in ['.git', '__pycache__', 'node_modules']):
-            continue
-            
-        analysis['directory_count'] += 1
-        
-        for file in files:
-            analysis['file_count'] += 1
-            file_path = Path(root) / file
-            
-            # Check for common issues
-            if ' ' in file:
-                analysis['issues'].append(f"Space in filename: {file_path}")
-                
-            if file != file.lower() and not file.startswith('README'):
-                analysis['issues'].append(f"Uppercase in filename: {file_path}")
-                
-            if file.endswith(('.jx', '.htm')):
-                analysis['issues'].append(f"Non-standard extension: {file_path}")
+    _scan_directory(root_path, analysis)
     
     # Generate recommendations
     if not (Path(root_path) / 'public' / 'index.html').exists():
@@ -19,5 +19,7 @@ def setup_logger(name=__name__, level=logging.INFO):
         )
         handler.setFormatter(formatter)
         logger.addHandler(handler)
+        # Don't also emit through any handlers installed on the root logger
+        logger.propagate = False
     
     return logger
\ No newline at end of file